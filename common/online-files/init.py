@@ -106,7 +106,7 @@ def try_catch(func):
         try:
             func()
         except Exception as e:
-            logging.exception("Exception happened. detail: {}".format(e))
+            logging.exception("Exception happened. detail: %s", e)
 
     return fn
 
@@ -191,6 +191,6 @@ if __name__ == '__main__':
             with open(flag_file, 'w') as fo:
                 pass
         except Exception as e:
-            logging.exception("Exception happened. detail: {}".format(e))
+            logging.exception("Exception happened. detail: %s", e)
     else:
         print("Ignore...")
\ No newline at end of file